@@ -1,35 +1,130 @@
-import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    import orjson as _json_impl
+except ImportError:
+    # orjson не установлен — используем стандартный json
+    import json as _json_impl
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 
 DATA_PATH = Path("data/botsv1.json") 
 OUT_DIR = Path("output")
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# файлы больше этого размера читаем потоково (ijson), чтобы не держать в памяти весь JSON
+STREAM_THRESHOLD = 200_000_000
+
+# строки храним в Arrow-буферах (если есть pyarrow), а не как object-массив Python str
+STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else str
+
+# кандидаты на колонку с кодом события Windows (в botsv1 встречается EventCode и signature_id)
+EVENT_COLS = ("EventCode", "signature_id", "EventID", "event_id")
+# кандидаты на колонку с DNS именем запроса, затем — сырой текст, из которого его можно вытащить
+QUERY_COLS = ("query", "query_name", "dns_query", "dest_dns", "Domain", "domain", "QueryName")
+RAW_TEXT_COLS = ("Message", "_raw", "body")
+QNAME_SOURCE_COLS = QUERY_COLS + RAW_TEXT_COLS
+# по наличию этих колонок можно опознать DNS, если нет source/sourcetype
+DNS_HINT_COLS = frozenset({"query", "query_name", "domain", "dest_dns", "dns_query"})
+
+# поля, которые реально используются дальше; остальные при загрузке не храним
+KEEP_COLS = ("_time", "source", "sourcetype") + EVENT_COLS + QUERY_COLS + RAW_TEXT_COLS
+
+# коды событий Windows, которые считаем подозрительными, и их описания
+SUSPICIOUS_IDS = {
+    # логины
+    "4625": "Failed logon (4625)",
+    "4624": "Successful logon (4624) - check anomalies",
+    "4648": "Logon with explicit creds (4648)",
+    "4672": "Special privileges assigned (4672)",
+    # управление пользователями/группами
+    "4720": "User account created (4720)",
+    "4722": "User enabled (4722)",
+    "4723": "Password change attempt (4723)",
+    "4724": "Password reset attempt (4724)",
+    "4728": "Added to privileged group (4728)",
+    "4732": "Added to local group (4732)",
+    "4756": "Added to universal group (4756)",
+    # процессы/службы/планировщик
+    "4688": "Process created (4688)",
+    "4697": "Service installed (4697)",
+    "7045": "Service created (7045)",
+    "4698": "Scheduled task created (4698)",
+    "4699": "Scheduled task deleted (4699)",
+    # логи/аудит
+    "1102": "Audit log cleared (1102)",
+    "4719": "Audit policy changed (4719)",
+    "4703": "User right adjusted (4703)"
+}
+SUSPICIOUS_ID_SET = frozenset(SUSPICIOUS_IDS)
+
+# одна фигура (Agg, без pyplot) на все графики: между вызовами plot_top10 только очищаем оси
+_FIG = Figure(figsize=(12, 6))
+_CANVAS = FigureCanvasAgg(_FIG)
+_AX = _FIG.add_subplot(111)
+
+# регулярки компилируем один раз при импорте модуля
+DOMAIN_RE = re.compile(r"([a-zA-Z0-9\-]{1,63}(?:\.[a-zA-Z0-9\-]{1,63})+\.[a-zA-Z]{2,})")
+# "голое" имя запроса: только символы DNS-имён, без какого-либо окружения
+BARE_NAME_RE = re.compile(r"[A-Za-z0-9._\-]+")
+
+# пороги "нестандартного поддомена": длина имени, число точек, число цифр
+QNAME_LEN_MIN = 40
+DOTS_MIN = 5
+DIGITS_MIN = 10
+
+
+def iter_raw_items(path: Path):
+    """
+    Отдаёт элементы верхнеуровневого массива JSON по одному.
+    """
+    if ijson is not None and path.stat().st_size >= STREAM_THRESHOLD:
+        with path.open("rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+
+    # orjson.loads и json.loads оба принимают bytes
+    yield from _json_impl.loads(path.read_bytes())
+
 
 def load_botsv1_json(path: Path) -> pd.DataFrame:
     
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
-
     # raw может быть списком: [{ "result": {...}}, ...]
-    rows = []
-    for item in raw:
-        if isinstance(item, dict) and "result" in item and isinstance(item["result"], dict):
-            rows.append(item["result"])
-        elif isinstance(item, dict):
-            # на случай если "result" отсутствует и поля на верхнем уровне
-            rows.append(item)
-        else:
-            # если элемент не словарь — пропускаем
-            continue
-
-    df = pd.DataFrame(rows)
+    # если "result" отсутствует — поля на верхнем уровне; не-словари пропускаем
+    rows = [
+        item["result"] if isinstance(item.get("result"), dict) else item
+        for item in iter_raw_items(path)
+        if isinstance(item, dict)
+    ]
+
+    # в DataFrame берём только KEEP_COLS, и только те, что встретились хотя бы в одной записи
+    seen = set().union(*rows)
+    df = pd.DataFrame(rows, columns=[c for c in KEEP_COLS if c in seen])
+    # все поля, кроме _time (его разбирает normalize_time), — строковые
+    text_cols = [c for c in df.columns if c != "_time"]
+    df = df.astype(dict.fromkeys(text_cols, STRING_DTYPE))
     return df
 
 
@@ -40,6 +135,17 @@ def normalize_time(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def category_mask(col: pd.Series, predicate) -> np.ndarray:
+    """
+    Считаем predicate только по уникальным значениям колонки (категориям)
+    и раскладываем результат по строкам через коды. Пропуски (NaN) -> False.
+    """
+    cat = col.astype("category")
+    cat_mask = np.asarray(predicate(cat.cat.categories.astype(str)), dtype=bool)
+    # код -1 (NaN) попадает на добавленный в конец False
+    return np.append(cat_mask, False)[cat.cat.codes.to_numpy()]
+
+
 def split_logs(df: pd.DataFrame):
     """
     Делим на WinEventLog и DNS по полю "source" / "sourcetype" / "eventtype" (что найдём).
@@ -47,88 +153,68 @@ def split_logs(df: pd.DataFrame):
     # Windows (в примерах видно source = "WinEventLog:Security")
     is_win = False
     if "source" in df.columns:
-        is_win = df["source"].astype(str).str.contains("WinEventLog", na=False)
+        is_win = category_mask(df["source"], lambda c: c.str.contains("WinEventLog", regex=False, na=False))
     elif "sourcetype" in df.columns:
-        is_win = df["sourcetype"].astype(str).str.contains("WinEventLog", na=False)
+        is_win = category_mask(df["sourcetype"], lambda c: c.str.contains("WinEventLog", regex=False, na=False))
 
-    win_df = df[is_win].copy()
+    win_df = df[is_win]
 
     # DNS: ищем по sourcetype/source/eventtype
     is_dns = False
     if "sourcetype" in df.columns:
-        is_dns = df["sourcetype"].astype(str).str.contains("dns", case=False, na=False)
+        is_dns = category_mask(df["sourcetype"], lambda c: c.str.contains("dns", case=False, regex=False, na=False))
     elif "source" in df.columns:
-        is_dns = df["source"].astype(str).str.contains("dns", case=False, na=False)
+        is_dns = category_mask(df["source"], lambda c: c.str.contains("dns", case=False, regex=False, na=False))
     else:
         # иногда DNS можно вычислить по наличию query/domain поля, но это запасной вариант
-        possible_dns_cols = {"query", "query_name", "domain", "dest_dns", "dns_query"}
-        is_dns = df.columns.to_series().isin(possible_dns_cols).any()
+        is_dns = not DNS_HINT_COLS.isdisjoint(df.columns)
 
-    dns_df = df[is_dns].copy()
+    dns_df = df[is_dns]
 
     return win_df, dns_df
 
 
+def sizes_to_top(sizes: pd.Series, n=10) -> pd.DataFrame:
+    """
+    Готовые частоты (Series: значение -> count) -> DataFrame ["key", "count"]
+    по убыванию count (n=None — без ограничения).
+    """
+    sizes = sizes.nlargest(n) if n is not None else sizes.sort_values(ascending=False, kind="stable")
+    return sizes.rename("count").rename_axis("key").reset_index()
+
+
+def top_counts(keys: pd.Series, n=10) -> pd.DataFrame:
+    """
+    Частоты значений keys -> DataFrame ["key", "count"] (см. sizes_to_top).
+    """
+    return sizes_to_top(keys.groupby(keys, sort=False, observed=True).size(), n)
+
+
 def suspicious_wineventlog(win_df: pd.DataFrame) -> pd.DataFrame:
    
-    # В botsv1 встречается EventCode и signature_id
-    event_col = None
-    for c in ["EventCode", "signature_id", "EventID", "event_id"]:
-        if c in win_df.columns:
-            event_col = c
-            break
+    cols = frozenset(win_df.columns)
+    event_col = next((c for c in EVENT_COLS if c in cols), None)
 
     if event_col is None or win_df.empty:
         return pd.DataFrame(columns=["type", "key", "count"])
 
-    win_df[event_col] = win_df[event_col].astype(str)
-
-    suspicious_ids = {
-        # логины
-        "4625": "Failed logon (4625)",
-        "4624": "Successful logon (4624) - check anomalies",
-        "4648": "Logon with explicit creds (4648)",
-        "4672": "Special privileges assigned (4672)",
-        # управление пользователями/группами
-        "4720": "User account created (4720)",
-        "4722": "User enabled (4722)",
-        "4723": "Password change attempt (4723)",
-        "4724": "Password reset attempt (4724)",
-        "4728": "Added to privileged group (4728)",
-        "4732": "Added to local group (4732)",
-        "4756": "Added to universal group (4756)",
-        # процессы/службы/планировщик
-        "4688": "Process created (4688)",
-        "4697": "Service installed (4697)",
-        "7045": "Service created (7045)",
-        "4698": "Scheduled task created (4698)",
-        "4699": "Scheduled task deleted (4699)",
-        # логи/аудит
-        "1102": "Audit log cleared (1102)",
-        "4719": "Audit policy changed (4719)",
-        "4703": "User right adjusted (4703)"
-    }
-
     # Оставляем те события, которые есть в списке
-    flagged = win_df[win_df[event_col].isin(suspicious_ids.keys())].copy()
+    # (isin считаем по уникальным кодам событий, а не по каждой строке)
+    ev = win_df[event_col]
+    is_flagged = category_mask(ev, lambda c: c.isin(SUSPICIOUS_ID_SET))
+    flagged = ev[is_flagged].astype(str)
     if flagged.empty:
         # если в данных нет ни одного из выбранных — вернем топ по частоте EventCode как "подозрительные по частоте"
-        top = (
-            win_df[event_col]
-            .value_counts()
-            .head(10)
-            .reset_index()
-            .rename(columns={"index": "key", event_col: "count"})
-        )
+        top = top_counts(ev.astype(str))
         top["type"] = "WinEventLog (top by frequency)"
         return top[["type", "key", "count"]]
 
     # Группируем
-    cnt = flagged[event_col].value_counts().reset_index()
-    cnt.columns = ["key", "count"]
+    cnt = top_counts(flagged, n=None)
     cnt["type"] = "WinEventLog"
     # делаем человекочитаемое описание (key будет "4625 — Failed logon")
-    cnt["key"] = cnt["key"].map(lambda x: suspicious_ids.get(str(x), str(x)))
+    keys = cnt["key"].astype(str)
+    cnt["key"] = keys.map(SUSPICIOUS_IDS).fillna(keys)
     return cnt[["type", "key", "count"]]
 
 
@@ -144,6 +230,106 @@ def extract_domain(q: str) -> str:
     return ".".join(parts[-2:])
 
 
+def pack_strings(s: pd.Series):
+    """
+    Упаковываем строки в один буфер байт (utf-8) + смещения:
+    строка i занимает data[offsets[i]:offsets[i + 1]].
+    """
+    encoded = [x.encode("utf-8") for x in s.to_numpy()]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return offsets, data
+
+
+def count_per_row(offsets: np.ndarray, hits: np.ndarray) -> np.ndarray:
+    # префиксные суммы вместо np.add.reduceat: корректно и для пустых строк
+    csum = np.zeros(len(hits) + 1, dtype=np.int64)
+    np.cumsum(hits, out=csum[1:])
+    return csum[offsets[1:]] - csum[offsets[:-1]]
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def scan_qnames(offsets, data):
+        """
+        Один проход по байтам: длина (в символах), точки, цифры и маска эвристик.
+        """
+        n = len(offsets) - 1
+        out_len = np.empty(n, dtype=np.int64)
+        out_dots = np.empty(n, dtype=np.int64)
+        out_digits = np.empty(n, dtype=np.int64)
+        out_mask = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            length = 0
+            dots = 0
+            digits = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                b = data[j]
+                # байты-продолжения utf-8 (10xxxxxx) не начинают новый символ
+                length += (b & 0xC0) != 0x80
+                dots += b == 46  # "."
+                digits += (b >= 48) & (b <= 57)  # "0".."9"
+            out_len[i] = length
+            out_dots[i] = dots
+            out_digits[i] = digits
+            out_mask[i] = (length >= QNAME_LEN_MIN) | (dots >= DOTS_MIN) | (digits >= DIGITS_MIN)
+        return out_len, out_dots, out_digits, out_mask
+
+    @njit(parallel=True, cache=True)
+    def domain_bounds(offsets, data):
+        """
+        Границы домена (две последние метки) каждой строки внутри data:
+        идём с конца строки назад до второй точки.
+        """
+        n = len(offsets) - 1
+        starts = np.empty(n, dtype=np.int64)
+        ends = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            # как strip("."): точки по краям не считаем
+            while start < end and data[start] == 46:
+                start += 1
+            while end > start and data[end - 1] == 46:
+                end -= 1
+            dom_start = start
+            dots = 0
+            for j in range(end - 1, start - 1, -1):
+                if data[j] == 46:
+                    dots += 1
+                    if dots == 2:
+                        dom_start = j + 1
+                        break
+            starts[i] = dom_start
+            ends[i] = end
+        return starts, ends
+else:
+    def scan_qnames(offsets, data):
+        # numba не установлен — то же самое через numpy
+        out_len = count_per_row(offsets, (data & 0xC0) != 0x80)
+        out_dots = count_per_row(offsets, data == ord("."))
+        out_digits = count_per_row(offsets, (data >= ord("0")) & (data <= ord("9")))
+        out_mask = (out_len >= QNAME_LEN_MIN) | (out_dots >= DOTS_MIN) | (out_digits >= DIGITS_MIN)
+        return out_len, out_dots, out_digits, out_mask
+
+
+def extract_domains_packed(qname: pd.Series, offsets: np.ndarray, data: np.ndarray) -> pd.Series:
+    """
+    То же, что extract_domain для каждой строки, но по уже упакованным байтам qname
+    (qname должен быть в нижнем регистре).
+    """
+    if njit is None:
+        # без numba построчный helper быстрее, чем .str.rsplit(expand=True)
+        return qname.map(extract_domain)
+
+    starts, ends = domain_bounds(offsets, data)
+    buf = data.tobytes()
+    # режем только по ASCII-точкам, поэтому куски — корректный utf-8
+    domains = [buf[a:b].decode("utf-8") for a, b in zip(starts.tolist(), ends.tolist())]
+    return pd.Series(domains, index=qname.index, dtype=qname.dtype)
+
+
 def suspicious_dns(dns_df: pd.DataFrame) -> pd.DataFrame:
     """
     Ищем подозрительное в DNS
@@ -151,62 +337,60 @@ def suspicious_dns(dns_df: pd.DataFrame) -> pd.DataFrame:
     if dns_df.empty:
         return pd.DataFrame(columns=["type", "key", "count"])
 
-    # Пытаемся найти колонку с DNS именем запроса
-    query_col = None
-    for c in ["query", "query_name", "dns_query", "dest_dns", "Domain", "domain", "QueryName"]:
-        if c in dns_df.columns:
-            query_col = c
-            break
-
-    # Если нет явной колонки — пробуем вытащить из "Message"/"_raw"
-    if query_col is None:
-        for c in ["Message", "_raw", "body"]:
-            if c in dns_df.columns:
-                query_col = c
-                break
+    # Пытаемся найти колонку с DNS именем запроса,
+    # если нет явной колонки — пробуем вытащить из "Message"/"_raw"
+    cols = frozenset(dns_df.columns)
+    query_col = next((c for c in QNAME_SOURCE_COLS if c in cols), None)
 
     if query_col is None:
         return pd.DataFrame(columns=["type", "key", "count"])
 
-    s = dns_df[query_col].astype(str)
-
-    domain_like = s.str.extract(r"([a-zA-Z0-9\-]{1,63}(?:\.[a-zA-Z0-9\-]{1,63})+\.[a-zA-Z]{2,})", expand=False)
-    qname = domain_like.fillna(s).str.strip().str.lower()
+    # пустой запрос -> пустое имя (дальше работаем с байтами, NaN там не нужен)
+    s = dns_df[query_col].astype(STRING_DTYPE).fillna("")
 
-    dns_work = dns_df.copy()
-    dns_work["qname"] = qname
-    dns_work["domain"] = dns_work["qname"].map(extract_domain)
-    dns_work["qname_len"] = dns_work["qname"].str.len()
-    dns_work["dots"] = dns_work["qname"].str.count(r"\.")
-    dns_work["digits"] = dns_work["qname"].str.count(r"\d")
+    # regex нужен всему, что не является уже "голым" именем (свободный текст, URL,
+    # host:port, кавычки, key=value и т.п.); проверка fullmatch по классу символов — линейная
+    needs_extract = ~s.str.fullmatch(BARE_NAME_RE)
+    domain_like = s[needs_extract].str.extract(DOMAIN_RE, expand=False)
+    qname = s.mask(needs_extract, domain_like).fillna(s).str.strip().str.lower()
 
     # эвристики "нестандартного поддомена"
     # 1) очень длинное имя
     # 2) много уровней (точек)
     # 3) много цифр
-    suspicious_q = dns_work[
-        (dns_work["qname_len"] >= 40) |
-        (dns_work["dots"] >= 5) |
-        (dns_work["digits"] >= 10)
-    ].copy()
+    # длину, точки, цифры и маску считаем одним проходом по байтам
+    offsets, data = pack_strings(qname)
+    qname_len, dots, digits, suspicious_mask = scan_qnames(offsets, data)
+
+    # один assign вместо copy() + поколоночной записи
+    dns_work = dns_df.assign(
+        qname=qname,
+        domain=extract_domains_packed(qname, offsets, data),
+        qname_len=qname_len,
+        dots=dots,
+        digits=digits,
+    )
 
-    # частые обращения к доменам
-    domain_counts = dns_work["domain"].value_counts().reset_index()
-    domain_counts.columns = ["domain", "count_domains"]
+    # пустые ветки (нет ни редких доменов, ни странных имён) пропускаем целиком
+    parts = []
 
-    # редкие домены: встречаются 1-2 раза (можно расширить)
-    rare_domains = set(domain_counts[domain_counts["count_domains"] <= 2]["domain"].tolist())
+    # частоты доменов: один groupby, редкие (1-2 обращения, можно расширить) берём прямо из него
+    domain_sizes = dns_work.groupby("domain", sort=False, observed=True).size()
+    is_rare = domain_sizes.to_numpy() <= 2
+    if is_rare.any():
+        rare_top = sizes_to_top(domain_sizes[is_rare])
+        rare_top["type"] = "DNS (rare domains)"
+        parts.append(rare_top)
 
-    rare_hits = dns_work[dns_work["domain"].isin(rare_domains)]
-    rare_top = rare_hits["domain"].value_counts().head(10).reset_index()
-    rare_top.columns = ["key", "count"]
-    rare_top["type"] = "DNS (rare domains)"
+    if suspicious_mask.any():
+        weird_top = top_counts(dns_work.loc[suspicious_mask, "qname"])
+        weird_top["type"] = "DNS (weird subdomains)"
+        parts.append(weird_top)
 
-    weird_top = suspicious_q["qname"].value_counts().head(10).reset_index()
-    weird_top.columns = ["key", "count"]
-    weird_top["type"] = "DNS (weird subdomains)"
+    if not parts:
+        return pd.DataFrame(columns=["type", "key", "count"])
 
-    out = pd.concat([rare_top, weird_top], ignore_index=True)
+    out = pd.concat(parts, ignore_index=True)
     return out[["type", "key", "count"]]
 
 
@@ -220,15 +404,14 @@ def plot_top10(df: pd.DataFrame, title: str, filename: str):
     if df.empty:
         return
 
-    top10 = df.sort_values("count", ascending=False).head(10).copy()
-    plt.figure(figsize=(12, 6))
-    sns.barplot(data=top10, x="count", y="key")
-    plt.title(title)
-    plt.xlabel("Count")
-    plt.ylabel("Event / Query")
-    plt.tight_layout()
-    plt.savefig(OUT_DIR / filename, dpi=200)
-    plt.close()
+    top10 = df.sort_values("count", ascending=False).head(10)
+    _AX.clear()
+    sns.barplot(data=top10, x="count", y="key", ax=_AX)
+    _AX.set_title(title)
+    _AX.set_xlabel("Count")
+    _AX.set_ylabel("Event / Query")
+    _FIG.tight_layout()
+    _FIG.savefig(OUT_DIR / filename, dpi=200)
 
 
 def main():
@@ -237,22 +420,36 @@ def main():
 
     win_df, dns_df = split_logs(df)
 
-    win_susp = suspicious_wineventlog(win_df)
-    dns_susp = suspicious_dns(dns_df)
+    # пайплайны независимы и почти всё время проводят в C-коде без GIL — считаем параллельно.
+    # DNS остаётся в главном потоке: параллельные ядра numba (OpenMP), запущенные
+    # из фонового потока, могут подвесить выход интерпретатора
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        f_win = ex.submit(suspicious_wineventlog, win_df)
+        dns_susp = suspicious_dns(dns_df)
+        win_susp = f_win.result()
 
     # объединённая визуализация: топ по суммарной частоте
-    combined = pd.concat([win_susp, dns_susp], ignore_index=True)
+    # type/key — категории (groupby хэширует коды, а не строки), count — int32.
+    # Приводим уже после concat: у двух частей разные наборы категорий
+    combined = pd.concat([win_susp, dns_susp], ignore_index=True).astype(
+        {"type": "category", "key": "category", "count": "int32"}
+    )
     combined_top = (
-        combined.groupby(["type", "key"], as_index=False)["count"].sum()
+        combined.groupby(["type", "key"], as_index=False, observed=True)["count"].sum()
         .sort_values("count", ascending=False)
     )
 
-    save_tables(win_susp, dns_susp, combined_top)
+    # CSV пишем в фоне, пока рисуем графики; сами графики — по очереди (все рисуют на общих _FIG/_AX)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        f_tables = ex.submit(save_tables, win_susp, dns_susp, combined_top)
+
+        plot_top10(win_susp, "Top-10 suspicious WinEventLog events", "win_top10.png")
+        plot_top10(dns_susp, "Top-10 suspicious DNS events", "dns_top10.png")
+        combined_label = combined_top["type"].astype(str) + " | " + combined_top["key"].astype(str)
+        plot_top10(combined_top.assign(key=combined_label),
+                   "Top-10 suspicious events (combined)", "combined_top10.png")
 
-    plot_top10(win_susp, "Top-10 suspicious WinEventLog events", "win_top10.png")
-    plot_top10(dns_susp, "Top-10 suspicious DNS events", "dns_top10.png")
-    plot_top10(combined_top.assign(key=combined_top["type"] + " | " + combined_top["key"]),
-               "Top-10 suspicious events (combined)", "combined_top10.png")
+        f_tables.result()
 
     print("Done! Files saved to ./output")
 